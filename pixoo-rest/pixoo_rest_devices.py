@@ -8,11 +8,19 @@ from dataclasses import dataclass
 from typing import Iterable
 
 from pixoo import Pixoo
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
 
 from pixoo_rest.core.config import settings
 
+try:
+    import orjson
 
-@dataclass
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+
+
+@dataclass(slots=True)
 class DeviceContext:
     key: str
     host: str
@@ -27,15 +35,21 @@ class DeviceContext:
 class DeviceRegistry:
     def __init__(self, devices: Iterable[DeviceContext]):
         self.devices = list(devices)
-        self._by_key = {device.key.lower(): device for device in self.devices}
-        self._by_host = {device.host: device for device in self.devices}
+        # Single combined map with namespaced entries: keys default to
+        # hosts in the loader, so an un-namespaced merge could let one
+        # device's host shadow another device's alias (or vice versa).
+        self._lookup: dict[tuple[str, str], DeviceContext] = {
+            ("key", device.key.lower()): device for device in self.devices
+        }
+        for device in self.devices:
+            self._lookup[("host", device.host)] = device
         self.default = self.devices[0] if self.devices else None
 
     def select(self, device_key: str | None, host: str | None) -> DeviceContext | None:
         if device_key:
-            return self._by_key.get(device_key.lower())
+            return self._lookup.get(("key", device_key.lower()))
         if host:
-            return self._by_host.get(host)
+            return self._lookup.get(("host", host))
         return self.default
 
     def keys(self) -> list[str]:
@@ -60,31 +74,43 @@ def get_device_registry() -> DeviceRegistry:
     return DEVICE_REGISTRY
 
 
+_DEVICE_TYPE_MAP: dict[str, str] = {
+    "pixoo": "pixoo",
+    "timegate": "time_gate",
+    "time_gate": "time_gate",
+    "time-gate": "time_gate",
+    "time gate": "time_gate",
+    "auto": "auto",
+}
+
+
 def normalize_device_type(value: str | None) -> str:
-    normalized = (value or "pixoo").strip().lower()
-    normalized = normalized.replace("-", "_").replace(" ", "_")
-    if normalized in ("timegate", "time_gate"):
-        return "time_gate"
-    if normalized == "auto":
-        return "auto"
-    return "pixoo"
+    return _DEVICE_TYPE_MAP.get(value.strip().lower() if value else "pixoo", "pixoo")
 
 
-def _coerce_int(value: object, default: int) -> int:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return default
+class _RawDevice(BaseModel):
+    """Schema for one PIXOO_DEVICES_JSON entry; coercion runs in pydantic-core."""
 
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
 
-def _coerce_bool(value: object, default: bool) -> bool:
-    if value is None:
-        return default
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        return value.strip().lower() in ("1", "true", "yes", "y", "on")
-    return bool(value)
+    host: str = ""
+    name: str | None = None
+    key: str | None = None
+    device_type: str | None = None
+    screen_size: int = settings.pixoo_screen_size
+    debug: bool = settings.pixoo_debug
+    connection_retries: int = settings.pixoo_test_connection_retries
+
+    @field_validator("screen_size", "debug", "connection_retries", mode="wrap")
+    @classmethod
+    def _default_on_invalid(cls, value, handler, info):
+        # A bad secondary value (e.g. screen_size="abc" or
+        # connection_retries=null) falls back to the settings default
+        # instead of dropping a device that has a valid host.
+        try:
+            return handler(value)
+        except ValidationError:
+            return cls.model_fields[info.field_name].default
 
 
 def _ensure_unique_key(key: str, existing: set[str]) -> str:
@@ -104,33 +130,25 @@ def _load_devices_from_list(raw_devices: list[object]) -> list[DeviceContext]:
     used_keys: set[str] = set()
 
     for raw in raw_devices:
-        if not isinstance(raw, dict):
+        try:
+            parsed = _RawDevice.model_validate(raw)
+        except ValidationError:
             continue
-        host = str(raw.get("host") or "").strip()
+        host = parsed.host.strip()
         if not host:
             continue
-        name = str(raw.get("name") or "").strip() or None
-        key = str(raw.get("key") or name or host).strip()
-        if not key:
-            key = host
+        name = (parsed.name or "").strip() or None
+        key = (parsed.key or name or host).strip() or host
         key = _ensure_unique_key(key, used_keys)
 
-        device_type = normalize_device_type(raw.get("device_type"))
-        screen_size = _coerce_int(raw.get("screen_size"), settings.pixoo_screen_size)
-        debug = _coerce_bool(raw.get("debug"), settings.pixoo_debug)
-        retries = _coerce_int(
-            raw.get("connection_retries"),
-            settings.pixoo_test_connection_retries,
-        )
-
         devices.append(
             DeviceContext(
                 key=key,
                 host=host,
-                device_type=device_type,
-                screen_size=screen_size,
-                debug=debug,
-                connection_retries=retries,
+                device_type=normalize_device_type(parsed.device_type),
+                screen_size=parsed.screen_size,
+                debug=parsed.debug,
+                connection_retries=parsed.connection_retries,
                 name=name,
             )
         )
@@ -142,8 +160,9 @@ def load_devices_from_env() -> list[DeviceContext]:
     devices_json = os.getenv("PIXOO_DEVICES_JSON", "").strip()
     if devices_json:
         try:
-            raw_devices = json.loads(devices_json)
-        except json.JSONDecodeError as exc:
+            raw_devices = _json_loads(devices_json)
+        except ValueError as exc:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError alike.
             raise RuntimeError("PIXOO_DEVICES_JSON is not valid JSON") from exc
         if not isinstance(raw_devices, list):
             raise RuntimeError("PIXOO_DEVICES_JSON must be a JSON array")
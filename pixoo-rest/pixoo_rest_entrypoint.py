@@ -1,7 +1,9 @@
 """FastAPI entrypoint for Pixoo REST with Time Gate support and root redirect."""
 
+import asyncio
+import functools
 import sys
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.openapi.utils import get_openapi
@@ -19,20 +21,39 @@ from pixoo_rest_devices import (
     load_devices_from_env,
     normalize_device_type,
 )
-from pixoo_rest_timegate import router as timegate_router
+from pixoo_rest_timegate import (
+    close_http_client,
+    initialize_http_client,
+    reset_device_cache,
+    router as timegate_router,
+    start_keepalive_task,
+)
+
+
+# ASGI header names are already lowercase bytes per spec.
+_PREFIX_HEADERS = (
+    b"x-ingress-path",
+    b"x-forwarded-prefix",
+    b"x-forwarded-path",
+    b"x-script-name",
+)
 
 
 def _root_path_from_headers(headers):
-    for key in (
-        "x-ingress-path",
-        "x-forwarded-prefix",
-        "x-forwarded-path",
-        "x-script-name",
-    ):
-        value = headers.get(key)
-        if not value:
+    candidates: dict[bytes, bytes] = {}
+    for key, value in headers:
+        if key in _PREFIX_HEADERS:
+            candidates.setdefault(key, value)
+    for key in _PREFIX_HEADERS:
+        raw = candidates.get(key)
+        if raw is None:
             continue
-        value = value.split(",")[0].strip().rstrip("/")
+        value = raw.decode("latin1")
+        if "," in value:
+            value = value.split(",", 1)[0]
+        value = value.strip()
+        if value.endswith("/"):
+            value = value.rstrip("/")
         if not value:
             continue
         if not value.startswith("/"):
@@ -41,17 +62,12 @@ def _root_path_from_headers(headers):
     return ""
 
 
-def _resolve_device_selector(
-    device: str | None,
-    host: str | None,
-):
-    try:
-        registry = get_device_registry()
-    except RuntimeError as exc:
-        raise HTTPException(status_code=503, detail=str(exc)) from exc
-    device_key = device
-    host_value = host
-    selected = registry.select(device_key, host_value)
+@functools.lru_cache(maxsize=128)
+def _resolve_device_cached(device: str | None, host: str | None):
+    # lru_cache does not cache raised exceptions, so only successful
+    # lookups are memoized; failures re-run the registry lookup.
+    registry = get_device_registry()
+    selected = registry.select(device, host)
     if selected is None:
         available = ", ".join(registry.keys()) or "none"
         raise HTTPException(
@@ -61,6 +77,16 @@ def _resolve_device_selector(
     return selected
 
 
+def _resolve_device_selector(
+    device: str | None,
+    host: str | None,
+):
+    try:
+        return _resolve_device_cached(device, host)
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+
 def get_pixoo_for_request(
     request: Request,
     device: str | None = Query(
@@ -83,11 +109,28 @@ def get_pixoo_for_request(
     return selected.pixoo
 
 
+async def _probe_device(device) -> None:
+    """Run the connection-test retry loop for one Pixoo device."""
+    print(f"Connecting to Pixoo device '{device.key}' at {device.host}...")
+    for connection_test_count in range(device.connection_retries + 1):
+        if await asyncio.to_thread(utils.try_to_request, f"http://{device.host}/get"):
+            return
+        if connection_test_count == device.connection_retries:
+            raise RuntimeError(
+                f"ERROR: Failed to connect to Pixoo device '{device.key}' at {device.host}."
+            )
+        print(
+            f"Connection attempt {connection_test_count + 1} failed for {device.host}, retrying..."
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager - handles startup and shutdown."""
     devices = load_devices_from_env()
     registry = initialize_device_registry(devices)
+    _resolve_device_cached.cache_clear()
+    reset_device_cache()
 
     if not registry.devices:
         sys.exit("ERROR: No Pixoo devices configured.")
@@ -95,6 +138,7 @@ async def lifespan(app: FastAPI):
     print("Initializing Pixoo REST devices...")
     default_pixoo = None
 
+    pixoo_devices = []
     for device in registry.devices:
         device.device_type = normalize_device_type(device.device_type)
         if device.device_type == "auto":
@@ -111,18 +155,19 @@ async def lifespan(app: FastAPI):
             )
             continue
 
-        print(f"Connecting to Pixoo device '{device.key}' at {device.host}...")
-        for connection_test_count in range(device.connection_retries + 1):
-            if utils.try_to_request(f"http://{device.host}/get"):
-                break
-            if connection_test_count == device.connection_retries:
-                sys.exit(
-                    f"ERROR: Failed to connect to Pixoo device '{device.key}' at {device.host}."
-                )
-            print(
-                f"Connection attempt {connection_test_count + 1} failed for {device.host}, retrying..."
-            )
+        pixoo_devices.append(device)
 
+    # Probe all devices concurrently so startup cost is the slowest
+    # device's latency rather than the sum of all of them.
+    results = await asyncio.gather(
+        *(_probe_device(device) for device in pixoo_devices),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            sys.exit(str(result))
+
+    for device in pixoo_devices:
         device.pixoo = Pixoo(device.host, device.screen_size, device.debug)
         print(f"Successfully connected to Pixoo device '{device.key}' at {device.host}")
 
@@ -132,10 +177,22 @@ async def lifespan(app: FastAPI):
     if default_pixoo is not None:
         set_pixoo_instance(default_pixoo)
 
+    # Build the augmented OpenAPI schema now so the first /openapi.json
+    # request serves the cached copy instead of paying the full build.
+    pixoo_app.openapi_schema = _build_openapi_schema()
+
+    initialize_http_client()
+    keepalive_task = start_keepalive_task()
+
     yield
 
     # Shutdown: Cleanup if needed
     print("Shutting down...")
+    if keepalive_task is not None:
+        keepalive_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await keepalive_task
+    await close_http_client()
 
 
 # Create FastAPI app
@@ -157,10 +214,7 @@ pixoo_app.include_router(timegate_router)
 pixoo_app.dependency_overrides[get_pixoo] = get_pixoo_for_request
 
 
-def custom_openapi():
-    if pixoo_app.openapi_schema:
-        return pixoo_app.openapi_schema
-
+def _build_openapi_schema():
     schema = get_openapi(
         title=pixoo_app.title,
         version=pixoo_app.version,
@@ -188,17 +242,14 @@ def custom_openapi():
             if not isinstance(operation, dict):
                 continue
             params = operation.get("parameters", [])
-            if not any(p.get("in") == "query" and p.get("name") == "device" for p in params):
+            existing = {(p.get("in"), p.get("name")) for p in params}
+            if ("query", "device") not in existing:
                 params.append(device_param)
-            if not any(p.get("in") == "query" and p.get("name") == "host" for p in params):
+            if ("query", "host") not in existing:
                 params.append(host_param)
             operation["parameters"] = params
 
-    pixoo_app.openapi_schema = schema
-    return pixoo_app.openapi_schema
-
-
-pixoo_app.openapi = custom_openapi
+    return schema
 
 @pixoo_app.get("/health", response_model=HealthCheckResponse)
 async def health_check() -> HealthCheckResponse:
@@ -223,11 +274,7 @@ async def root() -> RootResponse:
 
 async def app(scope, receive, send):
     if scope.get("type") == "http":
-        headers = {
-            key.decode("latin1").lower(): value.decode("latin1")
-            for key, value in scope.get("headers", [])
-        }
-        root_path = _root_path_from_headers(headers)
+        root_path = _root_path_from_headers(scope.get("headers", ()))
         if root_path:
             scope = dict(scope)
             scope["root_path"] = root_path
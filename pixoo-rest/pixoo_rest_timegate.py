@@ -2,43 +2,155 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import functools
+import os
+import socket
+import time
+from typing import Annotated, Any, Callable, Literal
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+import orjson
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:  # pragma: no cover - aiohttp is an optional speedup
+    aiohttp = None
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
 from pixoo_rest.models.requests import DivoomApiResponse
 from pixoo_rest_devices import get_device_registry
 
-router = APIRouter(prefix="/timegate", tags=["timegate"])
+router = APIRouter(
+    prefix="/timegate",
+    tags=["timegate"],
+    default_response_class=ORJSONResponse,
+)
+
+# Static headers for every device request; set once on the client so
+# they are not rebuilt per call.
+_CLIENT_HEADERS = {
+    "Connection": "keep-alive",
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+
+# Parsed once; every command posts to this path on the device client.
+_POST_URL = httpx.URL("/post")
+
+# Per-host /post URLs for the aiohttp backend, parsed on first use so the
+# session is not re-parsing the same URL string on every request.
+_AIOHTTP_POST_URLS: dict[str, yarl.URL] = {}
+
+
+def _aiohttp_post_url(host: str) -> yarl.URL:
+    url = _AIOHTTP_POST_URLS.get(host)
+    if url is None:
+        url = _AIOHTTP_POST_URLS[host] = yarl.URL(f"http://{host}/post")
+    return url
+
+_BASE64_ALPHABET = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+)
+
+# Idempotent commands whose repeats with an identical payload inside the
+# window are answered from the last response instead of hitting the
+# device again. Frame uploads (Draw/SendHttpGif) must always flush.
+# The cache holds the raw response bytes: endpoints with different
+# parsers (and response models) can share one entry safely.
+_DEDUPE_WINDOW_S = 0.05
+_DEDUPED_COMMANDS = frozenset({"Channel/SetBrightness", "Draw/ResetHttpGifId"})
+_LAST_SENT: dict[tuple[str, str], tuple[float, bytes, bytes]] = {}
+
+# aiohttp sustains higher request rates than httpx for small JSON bodies;
+# set PIXOO_TIMEGATE_HTTP_BACKEND=httpx to fall back to the httpx pool.
+_USE_AIOHTTP = (
+    aiohttp is not None
+    and os.getenv("PIXOO_TIMEGATE_HTTP_BACKEND", "aiohttp").strip().lower()
+    == "aiohttp"
+)
+
+_HOST_CLIENTS: dict[str, httpx.AsyncClient] | None = None
+_AIOHTTP_SESSION = None
+
+
+def initialize_http_client() -> None:
+    """Open the HTTP client pool; called from the application lifespan."""
+    global _HOST_CLIENTS, _AIOHTTP_SESSION
+    _HOST_CLIENTS = {}
+    if _USE_AIOHTTP:
+        _AIOHTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=10.0),
+            headers=_CLIENT_HEADERS,
+        )
 
 
-def _validate_lcd_array(lcd_array: list[int]) -> list[int]:
-    if len(lcd_array) != 5:
-        raise HTTPException(status_code=422, detail="lcd_array must contain 5 items.")
-    if any(value not in (0, 1) for value in lcd_array):
-        raise HTTPException(status_code=422, detail="lcd_array values must be 0 or 1.")
-    return lcd_array
+async def close_http_client() -> None:
+    global _HOST_CLIENTS, _AIOHTTP_SESSION
+    if _HOST_CLIENTS is not None:
+        for client in _HOST_CLIENTS.values():
+            await client.aclose()
+        _HOST_CLIENTS = None
+    if _AIOHTTP_SESSION is not None:
+        await _AIOHTTP_SESSION.close()
+        _AIOHTTP_SESSION = None
+
+
+def get_http_client(host: str) -> httpx.AsyncClient:
+    """Return (creating on first use) the keep-alive client for a device host."""
+    if _HOST_CLIENTS is None:
+        raise RuntimeError("Time Gate HTTP client is not initialized")
+    client = _HOST_CLIENTS.get(host)
+    if client is None:
+        # TCP_NODELAY avoids Nagle's delay on the small command payloads;
+        # Divoom firmware is HTTP/1.1-only, so no HTTP/2 negotiation.
+        transport = httpx.AsyncHTTPTransport(
+            retries=0,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60),
+            socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
+        )
+        client = httpx.AsyncClient(
+            base_url=f"http://{host}",
+            timeout=10.0,
+            headers=_CLIENT_HEADERS,
+            transport=transport,
+        )
+        _HOST_CLIENTS[host] = client
+    return client
 
 
-def _select_timegate_device(
-    device: str | None = Query(
-        None,
-        description="Device alias configured in the add-on (defaults to first device).",
-    ),
-    host: str | None = Query(
-        None,
-        description="Device host/IP to target (overrides default device).",
-    ),
-):
-    try:
-        registry = get_device_registry()
-    except RuntimeError as exc:
-        raise HTTPException(status_code=503, detail=str(exc)) from exc
-    device_key = device
-    host_value = host
-    selected = registry.select(device_key, host_value)
+# All 32 possible screen selections, keyed by 5-bit mask (bit i = screen i),
+# so common patterns reuse one prebuilt list instead of a fresh allocation.
+_LCD_ARRAY_CACHE: dict[int, list[int]] = {
+    mask: [(mask >> i) & 1 for i in range(5)] for mask in range(32)
+}
+
+
+def _expand_lcd_mask(value: object) -> object:
+    if isinstance(value, int) and not isinstance(value, bool) and 0 <= value < 32:
+        return _LCD_ARRAY_CACHE[value]
+    return value
+
+
+# Validated in pydantic-core: exactly 5 screen flags, each 0 or 1.
+# An integer bitmask (0-31) is also accepted and expanded from the cache.
+_LcdArray = Annotated[
+    list[Annotated[int, Field(ge=0, le=1)]],
+    Field(min_length=5, max_length=5),
+    BeforeValidator(_expand_lcd_mask),
+]
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_timegate_device(device: str | None, host: str | None):
+    # lru_cache does not cache raised exceptions, so only successful
+    # Time Gate lookups are memoized across requests.
+    registry = get_device_registry()
+    selected = registry.select(device, host)
     if selected is None:
         available = ", ".join(registry.keys()) or "none"
         raise HTTPException(
@@ -53,196 +165,407 @@ def _select_timegate_device(
     return selected
 
 
-async def _post_command(payload: dict[str, Any], host: str) -> DivoomApiResponse:
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"http://{host}/post",
-                json=payload,
-            )
-            response.raise_for_status()
-            return DivoomApiResponse(**response.json())
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Time Gate request failed: {exc}",
-        ) from exc
-    except Exception as exc:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Time Gate request failed: {exc}",
-        ) from exc
+def reset_device_cache() -> None:
+    """Drop memoized lookups after the registry is reinitialized."""
+    _resolve_timegate_device.cache_clear()
 
 
-async def _post_raw(payload: dict[str, Any], host: str) -> dict[str, Any]:
+def _select_timegate_device(
+    device: str | None = Query(
+        None,
+        description="Device alias configured in the add-on (defaults to first device).",
+    ),
+    host: str | None = Query(
+        None,
+        description="Device host/IP to target (overrides default device).",
+    ),
+):
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        return _resolve_timegate_device(device, host)
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+
+# Periodic heartbeat that keeps the pooled connections warm across idle
+# gaps longer than the keep-alive expiry; disable via env var.
+_KEEPALIVE_ENABLED = os.getenv("PIXOO_TIMEGATE_KEEPALIVE", "true").strip().lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+_KEEPALIVE_INTERVAL_S = 20.0
+_KEEPALIVE_BODY = orjson.dumps({"Command": "Channel/GetAllConf"})
+
+
+async def _keepalive_loop() -> None:
+    while True:
+        await asyncio.sleep(_KEEPALIVE_INTERVAL_S)
+        try:
+            registry = get_device_registry()
+        except RuntimeError:
+            continue
+        for device in registry.devices:
+            if device.device_type != "time_gate":
+                continue
+            try:
+                await _send(device.host, _KEEPALIVE_BODY)
+            except Exception:
+                # An unreachable device (or any transport hiccup) must not
+                # kill the heartbeat for good; retry next cycle.
+                # CancelledError is a BaseException and still propagates.
+                continue
+
+
+def start_keepalive_task() -> asyncio.Task | None:
+    """Spawn the heartbeat task; returns None when disabled via env."""
+    if not _KEEPALIVE_ENABLED:
+        return None
+    return asyncio.create_task(_keepalive_loop())
+
+
+# Cap in-flight requests per device so bursts cannot open more sockets
+# than the firmware's HTTP stack can service, keeping tail latency bounded.
+_DEVICE_CONCURRENCY = 4
+_DEVICE_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
+
+
+def _device_semaphore(host: str) -> asyncio.Semaphore:
+    semaphore = _DEVICE_SEMAPHORES.get(host)
+    if semaphore is None:
+        semaphore = _DEVICE_SEMAPHORES[host] = asyncio.Semaphore(_DEVICE_CONCURRENCY)
+    return semaphore
+
+
+async def _send(host: str, body: bytes) -> bytes:
+    """POST a serialized payload to a device and return the response bytes."""
+    async with _device_semaphore(host):
+        if _AIOHTTP_SESSION is not None:
+            try:
+                async with _AIOHTTP_SESSION.post(
+                    _aiohttp_post_url(host), data=body
+                ) as response:
+                    response.raise_for_status()
+                    return await response.read()
+            # aiohttp raises asyncio.TimeoutError (not a ClientError) when
+            # the total timeout elapses; map it to 400 like httpx timeouts.
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Time Gate request failed: {exc}",
+                ) from exc
+        client = get_http_client(host)
+        try:
             response = await client.post(
-                f"http://{host}/post",
-                json=payload,
+                _POST_URL,
+                content=body,
             )
             response.raise_for_status()
-            return response.json()
-    except httpx.HTTPError as exc:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Time Gate request failed: {exc}",
-        ) from exc
-    except Exception as exc:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Time Gate request failed: {exc}",
-        ) from exc
+        except httpx.HTTPError as exc:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Time Gate request failed: {exc}",
+            ) from exc
+        return response.content
+
+
+async def _post(
+    payload: dict[str, Any],
+    host: str,
+    *,
+    parse: Callable[[bytes], Any] | None = None,
+) -> Any:
+    """POST a command payload to a device, parsing the body with ``parse``
+    (raw ``response.json()`` when no parser is given)."""
+    body = orjson.dumps(payload)
+    command = payload.get("Command")
+    dedupe_key = None
+    if command in _DEDUPED_COMMANDS:
+        dedupe_key = (host, command)
+        last = _LAST_SENT.get(dedupe_key)
+        if last is not None:
+            sent_at, sent_body, content = last
+            if sent_body == body and time.monotonic() - sent_at < _DEDUPE_WINDOW_S:
+                return parse(content) if parse else orjson.loads(content)
+
+    content = await _send(host, body)
+    if dedupe_key is not None:
+        _LAST_SENT[dedupe_key] = (time.monotonic(), body, content)
+    return parse(content) if parse else orjson.loads(content)
 
 
 class TimeGateSendGifRequest(BaseModel):
-    """Request model for sending GIF frames to Time Gate."""
+    """Request model for sending GIF frames to Time Gate.
+
+    Fields carry serialization aliases so model_dump(by_alias=True)
+    yields the Divoom wire payload directly; the inbound snake_case
+    field names are unchanged.
+    """
 
-    lcd_array: list[int] = Field(
+    model_config = ConfigDict(frozen=True)
+
+    command: Literal["Draw/SendHttpGif"] = Field(
+        default="Draw/SendHttpGif", serialization_alias="Command"
+    )
+    lcd_array: _LcdArray = Field(
         default_factory=lambda: [1, 1, 1, 1, 1],
+        serialization_alias="LcdArray",
         description="Target screens (5 values of 0/1).",
     )
-    pic_num: int = Field(..., ge=1, le=60, description="Total number of frames.")
-    pic_width: int | None = Field(
+    pic_num: int = Field(
+        ..., ge=1, le=60, serialization_alias="PicNum",
+        description="Total number of frames.",
+    )
+    pic_width: Literal[16, 32, 64, 128] | None = Field(
         default=None,
+        serialization_alias="PicWidth",
         description="Frame width (16, 32, 64, or 128). Defaults to PIXOO_SCREEN_SIZE.",
     )
-    pic_offset: int = Field(..., ge=0, description="Frame offset (0-based).")
-    pic_id: int = Field(..., ge=1, description="Animation ID.")
-    pic_speed: int = Field(..., ge=1, description="Frame delay in ms.")
-    pic_data: str = Field(..., description="Base64-encoded JPG data.")
+    pic_offset: int = Field(
+        ..., ge=0, serialization_alias="PicOffset",
+        description="Frame offset (0-based).",
+    )
+    pic_id: int = Field(
+        ..., ge=1, serialization_alias="PicID", description="Animation ID."
+    )
+    pic_speed: int = Field(
+        ..., ge=1, serialization_alias="PicSpeed", description="Frame delay in ms."
+    )
+    pic_data: str = Field(
+        ..., serialization_alias="PicData", description="Base64-encoded JPG data."
+    )
 
 
 class TimeGateSendTextRequest(BaseModel):
     """Request model for sending scrolling text to Time Gate."""
 
-    lcd_index: int = Field(..., ge=0, le=4, description="Target screen index (0-4).")
-    text_id: int = Field(default=1, ge=0, le=20, description="Unique text ID (0-19).")
+    model_config = ConfigDict(frozen=True)
+
+    command: Literal["Draw/SendHttpText"] = Field(
+        default="Draw/SendHttpText", serialization_alias="Command"
+    )
+    lcd_index: int = Field(
+        ..., ge=0, le=4, serialization_alias="LcdIndex",
+        description="Target screen index (0-4).",
+    )
+    text_id: int = Field(
+        default=1, ge=0, le=20, serialization_alias="TextId",
+        description="Unique text ID (0-19).",
+    )
     x: int = Field(default=0, ge=0, description="Start X position.")
     y: int = Field(default=0, ge=0, description="Start Y position.")
-    direction: int = Field(default=0, ge=0, le=1, description="0=left, 1=right.")
+    direction: int = Field(
+        default=0, ge=0, le=1, serialization_alias="dir", description="0=left, 1=right."
+    )
     font: int = Field(default=0, ge=0, le=7, description="Font index (0-7).")
-    text_width: int = Field(default=56, ge=16, le=64, description="Text width (16-64).")
-    text: str = Field(..., max_length=512, description="Text to display.")
+    text_width: int = Field(
+        default=56, ge=16, le=64, serialization_alias="TextWidth",
+        description="Text width (16-64).",
+    )
+    text: str = Field(
+        ..., max_length=512, serialization_alias="TextString",
+        description="Text to display.",
+    )
     speed: int = Field(default=10, ge=0, description="Scroll speed in ms per step.")
-    color: str = Field(default="#FFFFFF", description="Text color as hex string.")
+    color: str = Field(
+        default="#FFFFFF",
+        pattern=r"^#?[0-9A-Fa-f]{6}$",
+        description="Text color as hex string.",
+    )
     align: int = Field(default=1, ge=1, le=3, description="Alignment: 1=left, 2=center, 3=right.")
 
 
 class TimeGatePlayGifRequest(BaseModel):
     """Request model for playing GIFs on Time Gate."""
 
-    lcd_array: list[int] = Field(
+    model_config = ConfigDict(frozen=True)
+
+    command: Literal["Device/PlayGif"] = Field(
+        default="Device/PlayGif", serialization_alias="Command"
+    )
+    lcd_array: _LcdArray = Field(
         default_factory=lambda: [1, 1, 1, 1, 1],
+        serialization_alias="LcdArray",
         description="Target screens (5 values of 0/1).",
     )
-    file_name: list[str] = Field(..., description="List of GIF URLs.")
+    file_name: list[str] = Field(
+        ..., serialization_alias="FileName", description="List of GIF URLs."
+    )
 
 
 class TimeGateBrightnessRequest(BaseModel):
     """Request model for setting Time Gate brightness."""
 
-    brightness: int = Field(..., ge=0, le=100, description="Brightness (0-100).")
+    model_config = ConfigDict(frozen=True)
+
+    command: Literal["Channel/SetBrightness"] = Field(
+        default="Channel/SetBrightness", serialization_alias="Command"
+    )
+    brightness: int = Field(
+        ..., ge=0, le=100, serialization_alias="Brightness",
+        description="Brightness (0-100).",
+    )
 
 
 class TimeGateCommandListRequest(BaseModel):
     """Request model for sending a list of Time Gate commands."""
 
+    model_config = ConfigDict(frozen=True)
+
+    command: Literal["Draw/CommandList"] = Field(
+        default="Draw/CommandList", serialization_alias="Command"
+    )
     command_list: list[dict[str, Any]] = Field(
-        ..., description="List of command payloads."
+        ..., serialization_alias="CommandList", description="List of command payloads."
     )
 
 
 class TimeGateCommandRequest(BaseModel):
     """Request model for sending a raw Time Gate command."""
 
+    model_config = ConfigDict(frozen=True)
+
     command: dict[str, Any] = Field(..., description="Raw command payload.")
 
 
-@router.post("/send-gif", response_model=DivoomApiResponse)
+@router.post("/send-gif", response_model=None)
 async def send_gif(
     request: TimeGateSendGifRequest,
     device=Depends(_select_timegate_device),
 ) -> DivoomApiResponse:
     """Send a GIF frame (Draw/SendHttpGif)."""
-    lcd_array = _validate_lcd_array(request.lcd_array)
-    pic_width = request.pic_width or device.screen_size
-    payload = {
-        "Command": "Draw/SendHttpGif",
-        "LcdArray": lcd_array,
-        "PicNum": request.pic_num,
-        "PicWidth": pic_width,
-        "PicOffset": request.pic_offset,
-        "PicID": request.pic_id,
-        "PicSpeed": request.pic_speed,
-        "PicData": request.pic_data,
-    }
-    return await _post_command(payload, device.host)
-
-
-@router.post("/send-text", response_model=DivoomApiResponse)
+    payload = request.model_dump(by_alias=True)
+    if payload["PicWidth"] is None:
+        payload["PicWidth"] = device.screen_size
+    return await _post(
+        payload, device.host, parse=DivoomApiResponse.model_validate_json
+    )
+
+
+@router.post("/send-gif-batch", response_model=None)
+async def send_gif_batch(
+    frames: list[TimeGateSendGifRequest],
+    device=Depends(_select_timegate_device),
+) -> DivoomApiResponse:
+    """Send multiple GIF frames in one Draw/CommandList batch."""
+    if not frames:
+        raise HTTPException(status_code=422, detail="frames must not be empty.")
+    commands = []
+    for frame in frames:
+        command = frame.model_dump(by_alias=True)
+        if command["PicWidth"] is None:
+            command["PicWidth"] = device.screen_size
+        commands.append(command)
+    payload = {"Command": "Draw/CommandList", "CommandList": commands}
+    return await _post(
+        payload, device.host, parse=DivoomApiResponse.model_validate_json
+    )
+
+
+@router.post("/send-gif-raw", response_model=None)
+async def send_gif_raw(
+    pic_data: UploadFile = File(..., description="Base64-encoded JPG data."),
+    pic_num: int = Form(..., ge=1, le=60, description="Total number of frames."),
+    pic_offset: int = Form(..., ge=0, description="Frame offset (0-based)."),
+    pic_id: int = Form(..., ge=1, description="Animation ID."),
+    pic_speed: int = Form(..., ge=1, description="Frame delay in ms."),
+    pic_width: Literal[16, 32, 64, 128] | None = Form(
+        default=None,
+        description="Frame width (16, 32, 64, or 128). Defaults to PIXOO_SCREEN_SIZE.",
+    ),
+    lcd_mask: int = Form(
+        default=31, ge=0, le=31, description="Target screens as a 5-bit mask."
+    ),
+    device=Depends(_select_timegate_device),
+) -> DivoomApiResponse:
+    """Send a GIF frame with the base64 payload as a multipart file part.
+
+    The blob is forwarded as raw bytes spliced into the JSON envelope,
+    avoiding the str decode/re-encode round trip of /send-gif.
+    """
+    # Tolerate MIME-style line wrapping from standard encoders, then make
+    # sure only base64-alphabet bytes reach the envelope splice below.
+    data = b"".join((await pic_data.read()).split())
+    if not data or data.translate(None, delete=_BASE64_ALPHABET):
+        raise HTTPException(
+            status_code=422, detail="pic_data must be non-empty base64 data."
+        )
+    envelope = orjson.dumps(
+        {
+            "Command": "Draw/SendHttpGif",
+            "LcdArray": _LCD_ARRAY_CACHE[lcd_mask],
+            "PicNum": pic_num,
+            "PicWidth": pic_width or device.screen_size,
+            "PicOffset": pic_offset,
+            "PicID": pic_id,
+            "PicSpeed": pic_speed,
+        }
+    )
+    # Base64 needs no JSON escaping, so the blob can be embedded verbatim.
+    body = b'%s,"PicData":"%s"}' % (envelope[:-1], data)
+    content = await _send(device.host, body)
+    return DivoomApiResponse.model_validate_json(content)
+
+
+@router.post("/send-text", response_model=None)
 async def send_text(
     request: TimeGateSendTextRequest,
     device=Depends(_select_timegate_device),
 ) -> DivoomApiResponse:
     """Send scrolling text (Draw/SendHttpText)."""
-    payload = {
-        "Command": "Draw/SendHttpText",
-        "LcdIndex": request.lcd_index,
-        "TextId": request.text_id,
-        "x": request.x,
-        "y": request.y,
-        "dir": request.direction,
-        "font": request.font,
-        "TextWidth": request.text_width,
-        "TextString": request.text,
-        "speed": request.speed,
-        "color": request.color,
-        "align": request.align,
-    }
-    return await _post_command(payload, device.host)
-
-
-@router.post("/play-gif", response_model=DivoomApiResponse)
+    return await _post(
+        request.model_dump(by_alias=True),
+        device.host,
+        parse=DivoomApiResponse.model_validate_json,
+    )
+
+
+@router.post("/play-gif", response_model=None)
 async def play_gif(
     request: TimeGatePlayGifRequest,
     device=Depends(_select_timegate_device),
 ) -> DivoomApiResponse:
     """Play GIFs from URLs (Device/PlayGif)."""
-    lcd_array = _validate_lcd_array(request.lcd_array)
-    payload = {
-        "Command": "Device/PlayGif",
-        "LcdArray": lcd_array,
-        "FileName": request.file_name,
-    }
-    return await _post_command(payload, device.host)
+    return await _post(
+        request.model_dump(by_alias=True),
+        device.host,
+        parse=DivoomApiResponse.model_validate_json,
+    )
 
 
-@router.post("/set-brightness", response_model=DivoomApiResponse)
+@router.post("/set-brightness", response_model=None)
 async def set_brightness(
     request: TimeGateBrightnessRequest,
     device=Depends(_select_timegate_device),
 ) -> DivoomApiResponse:
     """Set brightness (Channel/SetBrightness)."""
-    payload = {"Command": "Channel/SetBrightness", "Brightness": request.brightness}
-    return await _post_command(payload, device.host)
+    return await _post(
+        request.model_dump(by_alias=True),
+        device.host,
+        parse=DivoomApiResponse.model_validate_json,
+    )
 
 
-@router.post("/reset-gif-id", response_model=DivoomApiResponse)
+@router.post("/reset-gif-id", response_model=None)
 async def reset_gif_id(device=Depends(_select_timegate_device)) -> DivoomApiResponse:
     """Reset GIF cache (Draw/ResetHttpGifId)."""
     payload = {"Command": "Draw/ResetHttpGifId"}
-    return await _post_command(payload, device.host)
+    return await _post(
+        payload, device.host, parse=DivoomApiResponse.model_validate_json
+    )
 
 
-@router.post("/command-list", response_model=DivoomApiResponse)
+@router.post("/command-list", response_model=None)
 async def command_list(
     request: TimeGateCommandListRequest,
     device=Depends(_select_timegate_device),
 ) -> DivoomApiResponse:
     """Send a list of commands (Draw/CommandList)."""
-    payload = {"Command": "Draw/CommandList", "CommandList": request.command_list}
-    return await _post_command(payload, device.host)
+    return await _post(
+        request.model_dump(by_alias=True),
+        device.host,
+        parse=DivoomApiResponse.model_validate_json,
+    )
 
 
 @router.post("/command")
@@ -251,4 +574,22 @@ async def command(
     device=Depends(_select_timegate_device),
 ) -> dict[str, Any]:
     """Send a raw command payload to the device."""
-    return await _post_raw(request.command, device.host)
+    return await _post(request.command, device.host)
+
+
+@router.post("/commands-parallel")
+async def commands_parallel(
+    commands: list[dict[str, Any]],
+    device=Depends(_select_timegate_device),
+) -> list[dict[str, Any]]:
+    """Send independent raw commands concurrently, one POST each.
+
+    Unlike /command-list, the commands are not batched into a single
+    Draw/CommandList; they are fired in parallel over the keep-alive
+    pool and the device responses are returned in request order.
+    """
+    if not commands:
+        raise HTTPException(status_code=422, detail="commands must not be empty.")
+    return list(
+        await asyncio.gather(*(_post(cmd, device.host) for cmd in commands))
+    )